@@ -1,26 +1,35 @@
 """Quick Timer - Schedule one-time actions for any entity."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import re
+from collections.abc import Coroutine, Mapping
+from datetime import datetime, time, timedelta
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    ATTR_DOMAIN,
+    ATTR_SERVICE,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
     SERVICE_TOGGLE,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
 )
 from homeassistant.core import (
+    Event,
     HomeAssistant,
     ServiceCall,
     callback,
 )
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import (
-    async_track_point_in_time,
+    async_track_point_in_utc_time,
 )
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
@@ -54,6 +63,8 @@ from .const import (
     UNIT_HOURS,
     UNIT_MINUTES,
     UNIT_SECONDS,
+    VALID_TIME_MODES,
+    VALID_UNITS,
 )
 from .store import QuickTimerStore, QuickTimerPreferencesStore
 
@@ -66,35 +77,104 @@ PLATFORMS = ["sensor"]
 # Allow configuration via configuration.yaml (optional)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-# Service schemas
-RUN_ACTION_SCHEMA = vol.Schema(
-    {
-        vol.Optional(ATTR_TASK_ID): cv.string,  # Unique ID for scoped tasks
-        vol.Optional(ATTR_DELAY): vol.All(
-            vol.Coerce(int), vol.Range(min=1, max=86400)
-        ),
-        vol.Optional(ATTR_UNIT, default=UNIT_MINUTES): vol.In([UNIT_SECONDS, UNIT_MINUTES, UNIT_HOURS]),
-        vol.Optional(ATTR_TASK_LABEL): cv.string,  # Human-readable label for overview
-        vol.Optional(ATTR_START_ACTIONS): vol.All(cv.ensure_list, [dict]),  # Execute on start (optional)
-        vol.Optional(ATTR_FINISH_ACTIONS): vol.All(cv.ensure_list, [dict]),  # Execute on finish (required)
-        vol.Optional(ATTR_NOTIFY, default=False): cv.boolean,
-        vol.Optional(ATTR_NOTIFY_HA, default=False): cv.boolean,
-        vol.Optional(ATTR_NOTIFY_MOBILE, default=False): cv.boolean,
-        vol.Optional(ATTR_NOTIFY_DEVICES): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional(ATTR_AT_TIME): cv.string,  # HH:MM format for absolute time
-        vol.Optional(ATTR_TIME_MODE, default=TIME_MODE_RELATIVE): vol.In([TIME_MODE_RELATIVE, TIME_MODE_ABSOLUTE]),
-    }
+# run_action is called on every timer start, so its data is validated by a
+# plain function instead of a voluptuous Schema (no per-call validator tree walk).
+
+
+def _delay(value: Any) -> int:
+    """Coerce the delay to int and check its range."""
+    value = int(value)
+    if not 1 <= value <= 86400:
+        raise vol.Invalid("value must be between 1 and 86400")
+    return value
+
+
+def _unit(value: Any) -> str:
+    """Check the time unit."""
+    if value not in VALID_UNITS:
+        raise vol.Invalid(f"value must be one of {sorted(VALID_UNITS)}")
+    return value
+
+
+def _time_mode(value: Any) -> str:
+    """Check the time mode."""
+    if value not in VALID_TIME_MODES:
+        raise vol.Invalid(f"value must be one of {sorted(VALID_TIME_MODES)}")
+    return value
+
+
+_AT_TIME_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]\d)(?::([0-5]\d))?")
+
+
+def _at_time(value: Any) -> str:
+    """Check an HH:MM[:SS] time and normalize it to zero-padded ISO form."""
+    match = _AT_TIME_RE.fullmatch(cv.string(value))
+    if match is None:
+        raise vol.Invalid("expected time in HH:MM or HH:MM:SS format")
+    hours, minutes, seconds = match.groups()
+    normalized = f"{int(hours):02d}:{minutes}"
+    return f"{normalized}:{seconds}" if seconds else normalized
+
+
+def _action_list(value: Any) -> list[dict[str, Any]]:
+    """Ensure a list of action definitions."""
+    value = cv.ensure_list(value)
+    if not all(isinstance(item, dict) for item in value):
+        raise vol.Invalid("expected a list of dictionaries")
+    return value
+
+
+def _string_list(value: Any) -> list[str]:
+    """Ensure a list of strings."""
+    return [cv.string(item) for item in cv.ensure_list(value)]
+
+
+_RUN_ACTION_VALIDATORS = (
+    (ATTR_TASK_ID, cv.string),  # Unique ID for scoped tasks
+    (ATTR_DELAY, _delay),
+    (ATTR_UNIT, _unit),
+    (ATTR_TASK_LABEL, cv.string),  # Human-readable label for overview
+    (ATTR_START_ACTIONS, _action_list),  # Execute on start (optional)
+    (ATTR_FINISH_ACTIONS, _action_list),  # Execute on finish (required)
+    (ATTR_NOTIFY, cv.boolean),
+    (ATTR_NOTIFY_HA, cv.boolean),
+    (ATTR_NOTIFY_MOBILE, cv.boolean),
+    (ATTR_NOTIFY_DEVICES, _string_list),
+    (ATTR_AT_TIME, _at_time),  # HH:MM format for absolute time
+    (ATTR_TIME_MODE, _time_mode),
 )
+_RUN_ACTION_FIELDS = frozenset(key for key, _ in _RUN_ACTION_VALIDATORS)
+_RUN_ACTION_DEFAULTS = {
+    ATTR_UNIT: UNIT_MINUTES,
+    ATTR_NOTIFY: False,
+    ATTR_NOTIFY_HA: False,
+    ATTR_NOTIFY_MOBILE: False,
+    ATTR_TIME_MODE: TIME_MODE_RELATIVE,
+}
+
+
+def _validate_run_action(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Validate run_action service data and apply defaults."""
+    if extra := data.keys() - _RUN_ACTION_FIELDS:
+        raise vol.Invalid(f"extra keys not allowed: {', '.join(sorted(extra))}")
+
+    validated = dict(_RUN_ACTION_DEFAULTS)
+    for key, validator in _RUN_ACTION_VALIDATORS:
+        if key not in data:
+            continue
+        try:
+            validated[key] = validator(data[key])
+        except (vol.Invalid, TypeError, ValueError) as err:
+            raise vol.Invalid(f"invalid value for {key}: {err}", path=[key]) from err
+    return validated
+
+
+_UNIT_TO_SECONDS = {UNIT_SECONDS: 1, UNIT_MINUTES: 60, UNIT_HOURS: 3600}
 
 
 def convert_to_seconds(delay: int, unit: str) -> int:
-    """Convert delay to seconds based on unit."""
-    if unit == UNIT_SECONDS:
-        return delay
-    elif unit == UNIT_HOURS:
-        return delay * 3600
-    else:  # default minutes
-        return delay * 60
+    """Convert delay to seconds based on unit (default minutes)."""
+    return delay * _UNIT_TO_SECONDS.get(unit, 60)
 
 
 CANCEL_ACTION_SCHEMA = vol.Schema(
@@ -128,6 +208,9 @@ class QuickTimerCoordinator:
         self._scheduled_tasks: dict[str, Any] = {}
         self._state_listeners: dict[str, Any] = {}
         self._sensor: Any = None
+        # notify.mobile_app_* services, kept in sync with the service registry
+        self._mobile_notify_services: set[str] = set()
+        self._service_listeners: list[Any] = []
 
     def register_sensor(self, sensor) -> None:
         """Register the monitoring sensor."""
@@ -137,14 +220,50 @@ class QuickTimerCoordinator:
         """Unregister the monitoring sensor."""
         self._sensor = None
 
-    def get_all_tasks(self) -> dict[str, Any]:
-        """Get all scheduled tasks."""
+    @callback
+    def async_track_notify_services(self) -> None:
+        """Start tracking notify.mobile_app_* services used for broadcasts."""
+        if self._service_listeners:
+            return
+
+        self._mobile_notify_services = {
+            service_name
+            for service_name in self.hass.services.async_services().get("notify", {})
+            if service_name.startswith("mobile_app_")
+        }
+        self._service_listeners = [
+            self.hass.bus.async_listen(event_type, self._async_notify_service_changed)
+            for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED)
+        ]
+
+    @callback
+    def _async_notify_service_changed(self, event: Event) -> None:
+        """Update the mobile_app notify service cache."""
+        if event.data[ATTR_DOMAIN] != "notify":
+            return
+        service_name = event.data[ATTR_SERVICE]
+        if not service_name.startswith("mobile_app_"):
+            return
+        if event.event_type == EVENT_SERVICE_REGISTERED:
+            self._mobile_notify_services.add(service_name)
+        else:
+            self._mobile_notify_services.discard(service_name)
+
+    def get_all_tasks(self) -> Mapping[str, Any]:
+        """Get a read-only live view of all scheduled tasks."""
         return self.store.get_all_tasks()
 
     def get_all_preferences(self) -> dict[str, Any]:
         """Get all preferences."""
         return self.preferences_store.get_all_preferences()
 
+    async def async_flush_stores(self) -> None:
+        """Write both stores to disk concurrently."""
+        await asyncio.gather(
+            self.store.async_flush(),
+            self.preferences_store.async_flush(),
+        )
+
     @callback
     def _update_sensor(self) -> None:
         """Update the sensor with current tasks."""
@@ -173,30 +292,39 @@ class QuickTimerCoordinator:
         task_label: str | None = None,
     ) -> None:
         """Schedule a task with start_actions (optional) and finish_actions (required)."""
-        # Cancel any existing task with this ID
-        await self.async_cancel_action(task_id, silent=True)
+        # Cancel any existing task with this ID and drop its record right away,
+        # so it is gone from the sensor while the start actions run
+        if self._cancel_sync(task_id, "user_request"):
+            self.store.remove_task(task_id)
+            self._update_sensor()
 
-        now = dt_util.now()
+        now = dt_util.utcnow()
         
-        # Calculate scheduled time based on mode
+        # Calculate scheduled time based on mode (kept in UTC)
         if time_mode == TIME_MODE_ABSOLUTE and at_time:
-            # Parse absolute time (HH:MM or HH:MM:SS format)
+            # Parse absolute time (HH:MM or HH:MM:SS, normalized by _at_time)
             try:
-                parts = at_time.split(':')
-                hours, minutes = int(parts[0]), int(parts[1])
-                seconds = int(parts[2]) if len(parts) > 2 else 0
-                scheduled_time = now.replace(hour=hours, minute=minutes, second=seconds, microsecond=0)
+                wall_time = time.fromisoformat(at_time)
+                # at_time is a wall-clock time, so resolve it in local time
+                local_now = dt_util.as_local(now)
+                scheduled_time = local_now.replace(
+                    hour=wall_time.hour,
+                    minute=wall_time.minute,
+                    second=wall_time.second,
+                    microsecond=0,
+                )
                 
                 # Handle crossing midnight - if the time is in the past, schedule for tomorrow
-                if scheduled_time <= now:
+                if scheduled_time <= local_now:
                     scheduled_time = scheduled_time + timedelta(days=1)
                     _LOGGER.info(
                         "Scheduled time %s is in the past, scheduling for tomorrow",
                         at_time,
                     )
                 
+                scheduled_time = dt_util.as_utc(scheduled_time)
                 delay_seconds = int((scheduled_time - now).total_seconds())
-            except (ValueError, AttributeError) as err:
+            except (ValueError, TypeError) as err:
                 _LOGGER.error("Invalid at_time format '%s': %s", at_time, err)
                 return
         else:
@@ -204,8 +332,7 @@ class QuickTimerCoordinator:
             delay_seconds = convert_to_seconds(delay, unit)
             scheduled_time = now + timedelta(seconds=delay_seconds)
 
-        scheduled_time_str = now.isoformat()
-        end_time_str = scheduled_time.isoformat()
+        start_actions = start_actions or []
 
         # Execute start actions immediately (if any)
         if start_actions:
@@ -216,13 +343,19 @@ class QuickTimerCoordinator:
                 except Exception as err:
                     _LOGGER.error("Start action %d failed for task %s: %s", idx, task_id, err)
 
+        # Formatted once here, shared by the store, the event and the log
+        scheduled_time_str = now.isoformat()
+        end_time_str = scheduled_time.isoformat()
+
         # Store the task
-        await self.store.async_add_task(
+        self.store.add_task(
             task_id=task_id,
             scheduled_time=scheduled_time_str,
             end_time=end_time_str,
             delay_seconds=delay_seconds,
-            start_actions=start_actions or [],
+            start_ts=now.timestamp(),
+            end_ts=scheduled_time.timestamp(),
+            start_actions=start_actions,
             finish_actions=finish_actions,
             notify=notify,
             notify_ha=notify_ha,
@@ -233,17 +366,32 @@ class QuickTimerCoordinator:
             task_label=task_label,
         )
 
+        # Record history for the primary target entity
+        if finish_actions:
+            primary_entity = finish_actions[0].get("target", {}).get("entity_id", task_id)
+            await self.preferences_store.async_add_to_history(
+                primary_entity,
+                {
+                    "delay": delay,
+                    "unit": unit,
+                    "time_mode": time_mode,
+                    "at_time": at_time,
+                    "start_actions": start_actions,
+                    "finish_actions": finish_actions,
+                },
+            )
+
         # Schedule the finish actions
-        cancel_callback = async_track_point_in_time(
+        cancel_callback = async_track_point_in_utc_time(
             self.hass,
-            self._create_finish_actions_callback(
-                task_id=task_id,
-                finish_actions=finish_actions,
-                notify=notify,
-                notify_ha=notify_ha,
-                notify_mobile=notify_mobile,
-                notify_devices=notify_devices,
-                task_label=task_label,
+            partial(
+                self._async_run_finish_actions,
+                task_id,
+                finish_actions,
+                notify_ha,
+                notify_mobile,
+                notify_devices,
+                task_label,
             ),
             scheduled_time,
         )
@@ -254,7 +402,7 @@ class QuickTimerCoordinator:
             EVENT_TASK_STARTED,
             {
                 "task_id": task_id,
-                "start_actions": start_actions or [],
+                "start_actions": start_actions,
                 "finish_actions": finish_actions,
                 "scheduled_time": scheduled_time_str,
                 "end_time": end_time_str,
@@ -262,23 +410,9 @@ class QuickTimerCoordinator:
             },
         )
 
-        # Add history entry for the primary target entity
+        # Update sensors
         if finish_actions:
-            primary_entity = finish_actions[0].get("target", {}).get("entity_id", task_id)
-            await self.preferences_store.async_add_to_history(
-                primary_entity,
-                {
-                    "delay": delay,
-                    "unit": unit,
-                    "time_mode": time_mode,
-                    "at_time": at_time,
-                    "start_actions": start_actions or [],
-                    "finish_actions": finish_actions,
-                },
-            )
             self._update_preferences_sensor()
-
-        # Update sensor
         self._update_sensor()
 
         # Send notification if enabled
@@ -308,21 +442,20 @@ class QuickTimerCoordinator:
         """Execute a single action definition from an action array.
         
         Action format: {"service": "domain.service", "target": {...}, "data": {...}}
+        Raises ValueError if the service is missing or malformed.
         """
         service = action_def.get("service")
         if not service:
-            _LOGGER.error("Action definition missing 'service' field: %s", action_def)
-            return
+            # Raised so callers count the action as failed
+            raise ValueError(f"Action definition missing 'service' field: {action_def}")
 
         target = action_def.get("target", {})
         data = action_def.get("data", {})
 
-        # Parse service
-        if "." in service:
-            domain, service_name = service.split(".", 1)
-        else:
-            _LOGGER.error("Invalid service format '%s': must be 'domain.service'", service)
-            return
+        # Parse service (single scan, stops at the first dot)
+        domain, _, service_name = service.partition(".")
+        if not domain or not service_name:
+            raise ValueError(f"Invalid service format '{service}': must be 'domain.service'")
 
         try:
             await self.hass.services.async_call(
@@ -341,134 +474,138 @@ class QuickTimerCoordinator:
 
     def _format_delay(self, delay: int, unit: str) -> str:
         """Format delay for display."""
-        if unit == UNIT_SECONDS:
-            return f"{delay} seconds"
-        elif unit == UNIT_HOURS:
-            return f"{delay} hours"
-        else:
-            return f"{delay} minutes"
+        return f"{delay} {unit if unit in _UNIT_TO_SECONDS else UNIT_MINUTES}"
 
-    def _create_finish_actions_callback(
+    async def _async_run_finish_actions(
         self,
         task_id: str,
         finish_actions: list[dict[str, Any]],
-        notify: bool = False,
-        notify_ha: bool = False,
-        notify_mobile: bool = False,
-        notify_devices: list[str] | None = None,
-        task_label: str | None = None,
-    ):
-        """Create a callback for executing finish actions when timer completes."""
-        display_name = task_label or task_id
-
-        async def execute_finish_actions(now) -> None:
-            """Execute all finish actions."""
-            _LOGGER.info("Executing %d finish actions for task %s", len(finish_actions), task_id)
+        notify_ha: bool,
+        notify_mobile: bool,
+        notify_devices: list[str] | None,
+        task_label: str | None,
+        now: datetime,
+    ) -> None:
+        """Execute all finish actions when a timer completes.
 
-            success_count = 0
-            error_count = 0
+        Bound to a task with functools.partial and passed to the time tracker.
+        """
+        display_name = task_label or task_id
+        _LOGGER.info("Executing %d finish actions for task %s", len(finish_actions), task_id)
 
-            for idx, action_def in enumerate(finish_actions):
-                try:
-                    await self._execute_action_definition(action_def)
-                    success_count += 1
-                except Exception as err:
-                    _LOGGER.error("Finish action %d failed for task %s: %s", idx, task_id, err)
-                    error_count += 1
+        success_count = 0
+        error_count = 0
 
-            # Fire completion event
-            self.hass.bus.async_fire(
-                EVENT_TASK_COMPLETED,
-                {
-                    "task_id": task_id,
-                    "finish_actions": finish_actions,
-                    "success_count": success_count,
-                    "error_count": error_count,
-                },
-            )
+        for idx, action_def in enumerate(finish_actions):
+            try:
+                await self._execute_action_definition(action_def)
+                success_count += 1
+            except Exception as err:
+                _LOGGER.error("Finish action %d failed for task %s: %s", idx, task_id, err)
+                error_count += 1
 
-            # Send notification if enabled
-            if notify_ha or notify_mobile or notify_devices:
-                if error_count > 0:
-                    await self._send_notification(
-                        f"Timer Completed: {display_name}",
-                        f"{success_count} actions succeeded, {error_count} failed",
-                        notify_ha=notify_ha,
-                        notify_mobile=notify_mobile,
-                        notify_devices=notify_devices,
-                    )
-                else:
-                    await self._send_notification(
-                        f"Timer Completed: {display_name}",
-                        f"All {success_count} actions executed successfully",
-                        notify_ha=notify_ha,
-                        notify_mobile=notify_mobile,
-                        notify_devices=notify_devices,
-                    )
+        # Fire completion event
+        self.hass.bus.async_fire(
+            EVENT_TASK_COMPLETED,
+            {
+                "task_id": task_id,
+                "finish_actions": finish_actions,
+                "success_count": success_count,
+                "error_count": error_count,
+            },
+        )
 
-            # Clean up
-            await self._cleanup_task(task_id)
+        # Send notification if enabled
+        if notify_ha or notify_mobile or notify_devices:
+            if error_count > 0:
+                await self._send_notification(
+                    f"Timer Completed: {display_name}",
+                    f"{success_count} actions succeeded, {error_count} failed",
+                    notify_ha=notify_ha,
+                    notify_mobile=notify_mobile,
+                    notify_devices=notify_devices,
+                    task_id=task_id,
+                    kind="completed",
+                )
+            else:
+                await self._send_notification(
+                    f"Timer Completed: {display_name}",
+                    f"All {success_count} actions executed successfully",
+                    notify_ha=notify_ha,
+                    notify_mobile=notify_mobile,
+                    notify_devices=notify_devices,
+                    task_id=task_id,
+                    kind="completed",
+                )
 
-        return execute_finish_actions
+        # Clean up
+        self._cleanup_task(task_id)
 
-    async def _cleanup_task(self, task_id: str) -> None:
+    @callback
+    def _cleanup_task(self, task_id: str) -> None:
         """Clean up a completed or cancelled task."""
-        # Remove from scheduled tasks
-        if task_id in self._scheduled_tasks:
-            del self._scheduled_tasks[task_id]
+        # Remove from scheduled tasks (the timer has already fired)
+        self._scheduled_tasks.pop(task_id, None)
 
         # Remove state listener (if any)
-        if task_id in self._state_listeners:
-            self._state_listeners[task_id]()
-            del self._state_listeners[task_id]
+        if (unsub := self._state_listeners.pop(task_id, None)) is not None:
+            unsub()
 
         # Remove from store
-        await self.store.async_remove_task(task_id)
+        self.store.remove_task(task_id)
 
         # Update sensor
         self._update_sensor()
 
-    async def async_shutdown(self) -> None:
+    @callback
+    def async_shutdown(self) -> None:
         """Cancel all in-memory callbacks without removing tasks from storage.
         
         Used during HA shutdown/restart to stop callbacks while preserving
         stored tasks for restoration after restart.
         """
         # Cancel all scheduled callbacks
-        for entity_id in list(self._scheduled_tasks.keys()):
+        # Unsubscribing does not touch these dicts, so no snapshot is needed
+        for cancel_callback in self._scheduled_tasks.values():
             try:
-                self._scheduled_tasks[entity_id]()
+                cancel_callback()
             except Exception:  # noqa: BLE001
                 pass
         self._scheduled_tasks.clear()
 
         # Remove all state listeners
-        for entity_id in list(self._state_listeners.keys()):
+        for unsub in self._state_listeners.values():
             try:
-                self._state_listeners[entity_id]()
+                unsub()
             except Exception:  # noqa: BLE001
                 pass
         self._state_listeners.clear()
 
+        # Stop tracking notify services
+        for unsub in self._service_listeners:
+            unsub()
+        self._service_listeners.clear()
+
         _LOGGER.info("Quick Timer shutdown: cancelled all in-memory callbacks, tasks preserved in storage")
 
-    async def async_cancel_action(
-        self, task_id: str, silent: bool = False, reason: str = "user_request"
-    ) -> bool:
-        """Cancel a scheduled task."""
-        if task_id not in self._scheduled_tasks and not self.store.has_task(task_id):
-            if not silent:
-                _LOGGER.debug("No scheduled task found for %s", task_id)
+    @callback
+    def _cancel_sync(self, task_id: str, reason: str) -> bool:
+        """Cancel the in-memory callbacks of a task and fire the cancel event.
+
+        Returns False if the task is unknown. Storage, sensor and notification
+        updates are left to _async_cancel_finish.
+        """
+        cancel_callback = self._scheduled_tasks.pop(task_id, None)
+        if cancel_callback is None and not self.store.has_task(task_id):
             return False
 
         # Cancel the scheduled callback
-        if task_id in self._scheduled_tasks:
-            self._scheduled_tasks[task_id]()
+        if cancel_callback is not None:
+            cancel_callback()
 
-        task = self.store.get_task(task_id)
-
-        # Clean up
-        await self._cleanup_task(task_id)
+        # Remove state listener (if any)
+        if (unsub := self._state_listeners.pop(task_id, None)) is not None:
+            unsub()
 
         # Fire cancellation event
         self.hass.bus.async_fire(
@@ -478,6 +615,12 @@ class QuickTimerCoordinator:
                 "reason": reason,
             },
         )
+        return True
+
+    async def _async_cancel_finish(self, task_id: str, reason: str, silent: bool) -> None:
+        """Remove a cancelled task from storage and send the cancel notification."""
+        task = self.store.pop_task(task_id)
+        self._update_sensor()
 
         if not silent and task and (task.get("notify_ha", False) or task.get("notify_mobile", False) or task.get("notify", False) or task.get("notify_devices")):
             display_name = task.get("task_label") or task_id
@@ -487,9 +630,22 @@ class QuickTimerCoordinator:
                 notify_ha=task.get("notify_ha", task.get("notify", False)),
                 notify_mobile=task.get("notify_mobile", False),
                 notify_devices=task.get("notify_devices"),
+                task_id=task_id,
+                kind="cancelled",
             )
 
         _LOGGER.info("Cancelled scheduled task %s (reason: %s)", task_id, reason)
+
+    async def async_cancel_action(
+        self, task_id: str, silent: bool = False, reason: str = "user_request"
+    ) -> bool:
+        """Cancel a scheduled task."""
+        if not self._cancel_sync(task_id, reason):
+            if not silent:
+                _LOGGER.debug("No scheduled task found for %s", task_id)
+            return False
+
+        await self._async_cancel_finish(task_id, reason, silent)
         return True
 
     async def _send_notification(
@@ -499,8 +655,14 @@ class QuickTimerCoordinator:
         notify_ha: bool = True,
         notify_mobile: bool = False,
         notify_devices: list[str] | None = None,
+        task_id: str | None = None,
+        kind: str = "",
     ) -> None:
-        """Send notifications (HA persistent and/or mobile push)."""
+        """Send notifications (HA persistent and/or mobile push).
+
+        The persistent notification id is derived from task_id and kind, so a
+        newer notification of the same kind replaces the previous one.
+        """
         # HA Persistent Notification
         if notify_ha:
             try:
@@ -510,7 +672,7 @@ class QuickTimerCoordinator:
                     {
                         "title": title,
                         "message": message,
-                        "notification_id": f"quick_timer_{hash(title + message) % 10000}",
+                        "notification_id": f"quick_timer_{task_id or 'misc'}_{kind}",
                     },
                 )
             except Exception as err:
@@ -555,15 +717,15 @@ class QuickTimerCoordinator:
                         continue
 
                     # Strategy A: Find a notify entity for this device
-                    notify_entity_id = None
-                    for entry in ent_registry.entities.values():
-                        if (
-                            entry.domain == "notify"
-                            and entry.device_id == device_id
-                            and entry.disabled_by is None
-                        ):
-                            notify_entity_id = entry.entity_id
-                            break
+                    # (device index lookup; disabled entities are excluded)
+                    notify_entity_id = next(
+                        (
+                            entry.entity_id
+                            for entry in er.async_entries_for_device(ent_registry, device_id)
+                            if entry.domain == "notify"
+                        ),
+                        None,
+                    )
 
                     if notify_entity_id:
                         try:
@@ -624,21 +786,18 @@ class QuickTimerCoordinator:
 
             # ── 2. Broadcast: send to all mobile_app devices ──
             else:
-                services = self.hass.services.async_services()
-                notify_services = services.get("notify", {})
-
                 sent_count = 0
-                for service_name in notify_services:
-                    if service_name.startswith("mobile_app_"):
-                        try:
-                            await self.hass.services.async_call(
-                                "notify", service_name, notify_data
-                            )
-                            sent_count += 1
-                        except Exception as e:
-                            _LOGGER.warning(
-                                "Broadcast to notify.%s failed: %s", service_name, e
-                            )
+                # Snapshot: the cache may change while a call is awaited
+                for service_name in tuple(self._mobile_notify_services):
+                    try:
+                        await self.hass.services.async_call(
+                            "notify", service_name, notify_data
+                        )
+                        sent_count += 1
+                    except Exception as e:
+                        _LOGGER.warning(
+                            "Broadcast to notify.%s failed: %s", service_name, e
+                        )
 
                 if sent_count == 0:
                     # Fallback: try entity-based broadcast
@@ -675,41 +834,46 @@ class QuickTimerCoordinator:
 
     async def async_restore_tasks(self) -> None:
         """Restore scheduled tasks after HA restart."""
-        tasks = self.store.get_all_tasks()
-        now = dt_util.now()
-
-        for task_id, task in list(tasks.items()):
+        # get_all_tasks() is a live view; snapshot it since invalid tasks are removed below
+        tasks = tuple(self.store.get_all_tasks().items())
+        now = dt_util.utcnow()
+        now_ts = now.timestamp()
+        # Missed tasks are executed together once all tasks are classified
+        missed: dict[str, Coroutine[Any, Any, None]] = {}
+
+        for task_id, task in tasks:
             end_time_str = task.get("end_time") or task.get("scheduled_time")
-            scheduled_time = dt_util.parse_datetime(end_time_str) if end_time_str else None
+            end_ts = task.get("end_ts")
 
-            if scheduled_time is None:
+            if end_ts is None:
                 _LOGGER.warning("Invalid scheduled time for task %s, removing", task_id)
-                await self.store.async_remove_task(task_id)
+                self.store.remove_task(task_id)
                 continue
 
             finish_actions = task.get("finish_actions", [])
             if not finish_actions:
                 _LOGGER.warning("Task %s has no finish_actions, removing", task_id)
-                await self.store.async_remove_task(task_id)
+                self.store.remove_task(task_id)
                 continue
 
-            if scheduled_time <= now:
+            finish_job = partial(
+                self._async_run_finish_actions,
+                task_id,
+                finish_actions,
+                task.get("notify_ha", False),
+                task.get("notify_mobile", False),
+                task.get("notify_devices"),
+                task.get("task_label"),
+            )
+
+            if end_ts <= now_ts:
                 # Task should have already executed, execute it now
                 _LOGGER.info(
                     "Executing missed task %s (was scheduled for %s)",
                     task_id,
                     end_time_str,
                 )
-                callback_fn = self._create_finish_actions_callback(
-                    task_id=task_id,
-                    finish_actions=finish_actions,
-                    notify=task.get("notify", False),
-                    notify_ha=task.get("notify_ha", False),
-                    notify_mobile=task.get("notify_mobile", False),
-                    notify_devices=task.get("notify_devices"),
-                    task_label=task.get("task_label"),
-                )
-                await callback_fn(now)
+                missed[task_id] = finish_job(now)
             else:
                 # Reschedule the task
                 _LOGGER.info(
@@ -717,21 +881,19 @@ class QuickTimerCoordinator:
                     task_id,
                     end_time_str,
                 )
-                cancel_callback = async_track_point_in_time(
+                cancel_callback = async_track_point_in_utc_time(
                     self.hass,
-                    self._create_finish_actions_callback(
-                        task_id=task_id,
-                        finish_actions=finish_actions,
-                        notify=task.get("notify", False),
-                        notify_ha=task.get("notify_ha", False),
-                        notify_mobile=task.get("notify_mobile", False),
-                        notify_devices=task.get("notify_devices"),
-                        task_label=task.get("task_label"),
-                    ),
-                    scheduled_time,
+                    finish_job,
+                    dt_util.utc_from_timestamp(end_ts),
                 )
                 self._scheduled_tasks[task_id] = cancel_callback
 
+        if missed:
+            results = await asyncio.gather(*missed.values(), return_exceptions=True)
+            for task_id, result in zip(missed, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Missed task %s failed: %s", task_id, result)
+
         self._update_sensor()
 
 
@@ -752,31 +914,30 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN]["coordinator"] = coordinator
     hass.data[DOMAIN]["store"] = store
     hass.data[DOMAIN]["preferences_store"] = preferences_store
+    coordinator.async_track_notify_services()
     
     # Restore tasks from storage
     await coordinator.async_restore_tasks()
     
-    # Register services immediately so they are available
+    # Register services immediately so they are available. The handlers bind
+    # the coordinator created above instead of looking it up on every call.
     async def handle_run_action(call: ServiceCall) -> None:
         """Handle the run_action service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return
+        data = _validate_run_action(call.data)
 
         # task_id + start_actions + finish_actions
-        task_id = call.data.get(ATTR_TASK_ID)
-        delay = call.data.get(ATTR_DELAY, 15)
-        unit = call.data.get(ATTR_UNIT, UNIT_MINUTES)
-        start_actions = call.data.get(ATTR_START_ACTIONS)
-        finish_actions = call.data.get(ATTR_FINISH_ACTIONS)
-        notify = call.data.get(ATTR_NOTIFY, False)
-        notify_ha = call.data.get(ATTR_NOTIFY_HA, False)
-        notify_mobile = call.data.get(ATTR_NOTIFY_MOBILE, False)
-        notify_devices = call.data.get(ATTR_NOTIFY_DEVICES, [])
-        task_label = call.data.get(ATTR_TASK_LABEL)
-        at_time = call.data.get(ATTR_AT_TIME)
-        time_mode = call.data.get(ATTR_TIME_MODE, TIME_MODE_RELATIVE)
+        task_id = data.get(ATTR_TASK_ID)
+        delay = data.get(ATTR_DELAY, 15)
+        unit = data[ATTR_UNIT]
+        start_actions = data.get(ATTR_START_ACTIONS)
+        finish_actions = data.get(ATTR_FINISH_ACTIONS)
+        notify = data[ATTR_NOTIFY]
+        notify_ha = data[ATTR_NOTIFY_HA]
+        notify_mobile = data[ATTR_NOTIFY_MOBILE]
+        notify_devices = data.get(ATTR_NOTIFY_DEVICES, [])
+        task_label = data.get(ATTR_TASK_LABEL)
+        at_time = data.get(ATTR_AT_TIME)
+        time_mode = data[ATTR_TIME_MODE]
 
         if not finish_actions:
             _LOGGER.error("'finish_actions' is required for quick_timer.run_action")
@@ -787,7 +948,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             task_str = str(finish_actions)
             task_id = f"task_{hashlib.md5(task_str.encode()).hexdigest()[:8]}"
 
-        await coord.async_schedule_action(
+        await coordinator.async_schedule_action(
             task_id=task_id,
             delay=delay,
             unit=unit,
@@ -804,83 +965,47 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def handle_cancel_action(call: ServiceCall) -> None:
         """Handle the cancel_action service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return
-            
         task_id = call.data.get(ATTR_TASK_ID)
 
         if not task_id:
             _LOGGER.error("'task_id' must be provided to cancel_action")
             return
 
-        await coord.async_cancel_action(task_id)
+        await coordinator.async_cancel_action(task_id)
 
     async def handle_get_preferences(call: ServiceCall) -> dict:
         """Handle the get_preferences service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return {}
-        
         entity_id = call.data.get(ATTR_ENTITY_ID)
         if entity_id:
-            return coord.preferences_store.get_preferences(entity_id)
+            return coordinator.preferences_store.get_preferences(entity_id)
         else:
-            return coord.preferences_store.get_all_preferences()
+            return coordinator.preferences_store.get_all_preferences()
 
     async def handle_set_preferences(call: ServiceCall) -> None:
         """Handle the set_preferences service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return
-        
         entity_id = call.data[ATTR_ENTITY_ID]
         preferences = call.data[ATTR_PREFERENCES]
         _LOGGER.info("Setting preferences for %s: %s", entity_id, preferences)
         
         # Use coordinator's preferences_store to ensure consistency
-        await coord.preferences_store.async_set_preferences(entity_id, preferences)
+        await coordinator.preferences_store.async_set_preferences(entity_id, preferences)
         _LOGGER.info("Preferences saved, updating sensor...")
         
         # Update sensor with new preferences
-        coord._update_preferences_sensor()
+        coordinator._update_preferences_sensor()
         _LOGGER.info("Sensor updated with new preferences")
 
-    # Only register if not already registered
-    if not hass.services.has_service(DOMAIN, SERVICE_RUN_ACTION):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_RUN_ACTION,
-            handle_run_action,
-            schema=RUN_ACTION_SCHEMA,
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_CANCEL_ACTION):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_CANCEL_ACTION,
-            handle_cancel_action,
-            schema=CANCEL_ACTION_SCHEMA,
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_GET_PREFERENCES):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_GET_PREFERENCES,
-            handle_get_preferences,
-            schema=GET_PREFERENCES_SCHEMA,
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_PREFERENCES):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_PREFERENCES,
-            handle_set_preferences,
-            schema=SET_PREFERENCES_SCHEMA,
-        )
+    # Only register once (async_setup may be re-entered from async_setup_entry)
+    if not hass.data[DOMAIN].get("_services_registered"):
+        for service, handler, schema in (
+            # run_action is validated by _validate_run_action in the handler
+            (SERVICE_RUN_ACTION, handle_run_action, None),
+            (SERVICE_CANCEL_ACTION, handle_cancel_action, CANCEL_ACTION_SCHEMA),
+            (SERVICE_GET_PREFERENCES, handle_get_preferences, GET_PREFERENCES_SCHEMA),
+            (SERVICE_SET_PREFERENCES, handle_set_preferences, SET_PREFERENCES_SCHEMA),
+        ):
+            hass.services.async_register(DOMAIN, service, handler, schema=schema)
+        hass.data[DOMAIN]["_services_registered"] = True
     
     _LOGGER.info("Quick Timer services registered successfully")
     return True
@@ -908,6 +1033,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN]["preferences_store"] = preferences_store
         await coordinator.async_restore_tasks()
 
+    # Resume notify service tracking (stopped by async_shutdown on unload)
+    hass.data[DOMAIN]["coordinator"].async_track_notify_services()
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -923,7 +1051,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Shutdown coordinator to cancel pending callbacks
         coordinator = hass.data[DOMAIN].get("coordinator")
         if coordinator:
-            await coordinator.async_shutdown()
+            coordinator.async_shutdown()
+            # Persist pending delayed saves before the entry goes away
+            await coordinator.async_flush_stores()
 
         # Automatically remove Lovelace resource when integration is unloaded/removed
         lovelace = hass.data.get("lovelace")
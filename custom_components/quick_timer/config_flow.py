@@ -1,6 +1,7 @@
 """Config flow for Quick Timer integration."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -8,7 +9,40 @@ import voluptuous as vol
 from homeassistant import config_entries
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN
+from .const import (
+    CONF_ENABLE_DIALOG_INJECTION,
+    CONF_PRESET_HOURS,
+    CONF_PRESET_MINUTES,
+    CONF_PRESET_SECONDS,
+    DEFAULT_ENABLE_DIALOG_INJECTION,
+    DEFAULT_PRESET_HOURS,
+    DEFAULT_PRESET_MINUTES,
+    DEFAULT_PRESET_SECONDS,
+    DOMAIN,
+)
+
+
+@lru_cache(maxsize=4)
+def _build_options_schema(
+    preset_seconds: str,
+    preset_minutes: str,
+    preset_hours: str,
+    enable_dialog_injection: bool,
+) -> vol.Schema:
+    """Build the options schema with the given defaults.
+
+    Cached per set of defaults; the schema is never mutated once built.
+    """
+    return vol.Schema(
+        {
+            vol.Optional(CONF_PRESET_SECONDS, default=preset_seconds): cv.string,
+            vol.Optional(CONF_PRESET_MINUTES, default=preset_minutes): cv.string,
+            vol.Optional(CONF_PRESET_HOURS, default=preset_hours): cv.string,
+            vol.Optional(
+                CONF_ENABLE_DIALOG_INJECTION, default=enable_dialog_injection
+            ): cv.boolean,
+        }
+    )
 
 
 class QuickTimerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -47,34 +81,15 @@ class QuickTimerOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        options = self.config_entry.options
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        "preset_seconds",
-                        default=self.config_entry.options.get(
-                            "preset_seconds", "5,10,15,20,30,45"
-                        ),
-                    ): cv.string,
-                    vol.Optional(
-                        "preset_minutes",
-                        default=self.config_entry.options.get(
-                            "preset_minutes", "1,2,3,5,10,15,20,30,45"
-                        ),
-                    ): cv.string,
-                    vol.Optional(
-                        "preset_hours",
-                        default=self.config_entry.options.get(
-                            "preset_hours", "1,2,3,4,6,8,12"
-                        ),
-                    ): cv.string,
-                    vol.Optional(
-                        "enable_dialog_injection",
-                        default=self.config_entry.options.get(
-                            "enable_dialog_injection", True
-                        ),
-                    ): cv.boolean,
-                }
+            data_schema=_build_options_schema(
+                options.get(CONF_PRESET_SECONDS, DEFAULT_PRESET_SECONDS),
+                options.get(CONF_PRESET_MINUTES, DEFAULT_PRESET_MINUTES),
+                options.get(CONF_PRESET_HOURS, DEFAULT_PRESET_HOURS),
+                options.get(
+                    CONF_ENABLE_DIALOG_INJECTION, DEFAULT_ENABLE_DIALOG_INJECTION
+                ),
             ),
         )
@@ -2,7 +2,7 @@
 
 DOMAIN = "quick_timer"
 STORAGE_KEY = "quick_timer_tasks"
-STORAGE_VERSION = 4  # Bumped for task_id-based storage and action arrays
+STORAGE_VERSION = 5  # Bumped for numeric start/end timestamps in task records
 
 # Separate storage for user preferences (synced across devices)
 PREFERENCES_STORAGE_KEY = "quick_timer_preferences"
@@ -33,11 +33,23 @@ ATTR_TASK_LABEL = "task_label"  # Human-readable label for the task (for overvie
 # Time modes
 TIME_MODE_RELATIVE = "relative"
 TIME_MODE_ABSOLUTE = "absolute"
+VALID_TIME_MODES = frozenset((TIME_MODE_RELATIVE, TIME_MODE_ABSOLUTE))
 
 # Time units
 UNIT_SECONDS = "seconds"
 UNIT_MINUTES = "minutes"
 UNIT_HOURS = "hours"
+VALID_UNITS = frozenset((UNIT_SECONDS, UNIT_MINUTES, UNIT_HOURS))
+
+# Options (defaults for the options flow and the monitor sensor)
+CONF_PRESET_SECONDS = "preset_seconds"
+CONF_PRESET_MINUTES = "preset_minutes"
+CONF_PRESET_HOURS = "preset_hours"
+CONF_ENABLE_DIALOG_INJECTION = "enable_dialog_injection"
+DEFAULT_PRESET_SECONDS = "5,10,15,20,30,45"
+DEFAULT_PRESET_MINUTES = "1,2,3,5,10,15,20,30,45"
+DEFAULT_PRESET_HOURS = "1,2,3,4,6,8,12"
+DEFAULT_ENABLE_DIALOG_INJECTION = True
 
 # Sensor
 SENSOR_NAME = "Quick Timer Monitor"
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
@@ -11,7 +12,18 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SENSOR_NAME
+from .const import (
+    CONF_ENABLE_DIALOG_INJECTION,
+    CONF_PRESET_HOURS,
+    CONF_PRESET_MINUTES,
+    CONF_PRESET_SECONDS,
+    DEFAULT_ENABLE_DIALOG_INJECTION,
+    DEFAULT_PRESET_HOURS,
+    DEFAULT_PRESET_MINUTES,
+    DEFAULT_PRESET_SECONDS,
+    DOMAIN,
+    SENSOR_NAME,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +35,8 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Quick Timer sensor."""
     coordinator = hass.data[DOMAIN]["coordinator"]
-    async_add_entities([QuickTimerSensor(coordinator, config_entry)], True)
+    # The sensor has no async_update; its state is pushed by the coordinator
+    async_add_entities([QuickTimerSensor(coordinator, config_entry)])
 
 
 class QuickTimerSensor(SensorEntity):
@@ -38,7 +51,7 @@ class QuickTimerSensor(SensorEntity):
         self._coordinator = coordinator
         self._config_entry = config_entry
         self._attr_unique_id = "quick_timer_monitor"
-        self._active_tasks: dict[str, Any] = {}
+        self._active_tasks: Mapping[str, Any] = {}
         self._preferences: dict[str, Any] = {}
 
     @property
@@ -56,43 +69,27 @@ class QuickTimerSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes with active task details."""
-        now = dt_util.now()
+        now_ts = dt_util.utcnow().timestamp()
         tasks_with_remaining = {}
         
         for task_id, task in self._active_tasks.items():
-            end_time_str = task.get("end_time") or task.get("scheduled_time")
-            start_time_str = task.get("scheduled_time")  # Toto je reálny čas štartu
-            
-            if end_time_str:
-                try:
-                    end_time = dt_util.parse_datetime(end_time_str)
-                    start_timestamp = None
-                    if start_time_str:
-                        start_time = dt_util.parse_datetime(start_time_str)
-                        if start_time:
-                            start_timestamp = start_time.timestamp()
-
-                    if end_time:
-                        remaining_seconds = max(0, int((end_time - now).total_seconds()))
-                        tasks_with_remaining[task_id] = {
-                            **task,
-                            "remaining_seconds": remaining_seconds,
-                            "end_timestamp": end_time.timestamp(),
-                            "start_timestamp": start_timestamp,
-                        }
-                    else:
-                        tasks_with_remaining[task_id] = task
-                except (ValueError, TypeError):
-                    tasks_with_remaining[task_id] = task
-            else:
+            end_ts = task.get("end_ts")
+            if end_ts is None:
                 tasks_with_remaining[task_id] = task
+            else:
+                tasks_with_remaining[task_id] = {
+                    **task,
+                    "remaining_seconds": max(0, int(end_ts - now_ts)),
+                    "end_timestamp": end_ts,
+                    "start_timestamp": task.get("start_ts"),  # Toto je reálny čas štartu
+                }
         
         # Get presets from options
         options = self._config_entry.options
-        preset_seconds = self._parse_presets(options.get("preset_seconds", "5,10,15,20,30,45"))
-        preset_minutes = self._parse_presets(options.get("preset_minutes", "1,2,3,5,10,15,20,30,45"))
-        preset_hours = self._parse_presets(options.get("preset_hours", "1,2,3,4,6,8,12"))
-        enable_dialog_injection = options.get("enable_dialog_injection", True)
+        preset_seconds = self._parse_presets(options.get(CONF_PRESET_SECONDS, DEFAULT_PRESET_SECONDS))
+        preset_minutes = self._parse_presets(options.get(CONF_PRESET_MINUTES, DEFAULT_PRESET_MINUTES))
+        preset_hours = self._parse_presets(options.get(CONF_PRESET_HOURS, DEFAULT_PRESET_HOURS))
+        enable_dialog_injection = options.get(CONF_ENABLE_DIALOG_INJECTION, DEFAULT_ENABLE_DIALOG_INJECTION)
         
         return {
             "active_tasks": tasks_with_remaining,
@@ -107,8 +104,8 @@ class QuickTimerSensor(SensorEntity):
         }
 
     @callback
-    def update_tasks(self, tasks: dict[str, Any]) -> None:
-        """Update the active tasks."""
+    def update_tasks(self, tasks: Mapping[str, Any]) -> None:
+        """Update the active tasks (treated as read-only)."""
         self._active_tasks = tasks
         self.async_write_ha_state()
 
@@ -1,12 +1,15 @@
 """Storage handling for Quick Timer."""
 from __future__ import annotations
 
-import copy
 import logging
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
     STORAGE_KEY,
@@ -17,6 +20,56 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sentinel for dict.pop, so a missing key costs a single lookup
+_MISSING = object()
+
+# Seconds to wait before writing, so bursts of changes end up in one write.
+# Store flushes pending delayed writes itself when Home Assistant stops.
+SAVE_DELAY = 10
+
+
+# Enum-like task fields that repeat across records; interning them on load
+# lets all tasks share one string object per value instead of a decoded copy each.
+_INTERNED_FIELDS = ("time_mode",)
+
+
+def _intern_fields(record: dict[str, Any]) -> None:
+    """Intern the known enum-like string fields of a task record in place."""
+    for field in _INTERNED_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = sys.intern(value)
+
+
+def _history_key(entry: dict[str, Any]) -> tuple[Any, ...]:
+    """Build the key used to detect duplicate history entries.
+
+    Compared with == only (the action lists are not hashable).
+    """
+    return (
+        entry.get("time_mode", ""),
+        entry.get("delay", ""),
+        entry.get("unit", ""),
+        entry.get("at_time", ""),
+        entry.get("start_actions", []),
+        entry.get("finish_actions", []),
+    )
+
+
+def _iso_to_timestamp(value: str | None) -> float | None:
+    """Convert an ISO datetime string to a POSIX timestamp."""
+    if not value:
+        return None
+    try:
+        parsed = dt_util.parse_datetime(value)
+    except (ValueError, TypeError):
+        return None
+    return parsed.timestamp() if parsed else None
+
+
+# Task fields added in storage v5
+_V5_KEYS = frozenset(("start_ts", "end_ts"))
+
 
 class QuickTimerMigratableStore(Store):
     """Store with migration support for Quick Timer."""
@@ -28,12 +81,13 @@ class QuickTimerMigratableStore(Store):
         old_data: dict[str, Any],
     ) -> dict[str, Any]:
         """Migrate data from old versions."""
-        _LOGGER.info(
-            "Migrating Quick Timer storage from version %s.%s to %s",
-            old_major_version,
-            old_minor_version,
-            STORAGE_VERSION,
-        )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Migrating Quick Timer storage from version %s.%s to %s",
+                old_major_version,
+                old_minor_version,
+                STORAGE_VERSION,
+            )
 
         # Handle migration from any old version to v4 (task_id-based + action arrays)
         if old_major_version < 4:
@@ -46,6 +100,32 @@ class QuickTimerMigratableStore(Store):
             )
             return {}
 
+        # V5 adds numeric start_ts/end_ts next to the ISO strings
+        if old_major_version == 4:
+            if not old_data:
+                return {}
+            # Tasks are all written the same way, so the first one shows the shape
+            if _V5_KEYS.issubset(next(iter(old_data.values()))):
+                return old_data
+            # old_data is freshly decoded and replaced by the return value,
+            # so the tasks are updated in place instead of copied
+            for task in old_data.values():
+                # Tasks that already have every v5 field are kept as they are
+                if _V5_KEYS - task.keys():
+                    # Values already present in the task win over the derived ones
+                    task.setdefault(
+                        "start_ts", _iso_to_timestamp(task.get("scheduled_time"))
+                    )
+                    task.setdefault(
+                        "end_ts",
+                        _iso_to_timestamp(
+                            task.get("end_time") or task.get("scheduled_time")
+                        ),
+                    )
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("Migration complete. Migrated %d tasks.", len(old_data))
+            return old_data
+
         # If we don't know how to migrate, return empty data
         _LOGGER.warning("Unknown storage version %s, starting fresh", old_major_version)
         return {}
@@ -54,33 +134,64 @@ class QuickTimerMigratableStore(Store):
 class QuickTimerStore:
     """Class to manage Quick Timer task storage."""
 
+    __slots__ = ("hass", "_store", "_data", "_view", "_data_provider", "_dirty")
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the store."""
         self.hass = hass
         self._store = QuickTimerMigratableStore(hass, STORAGE_VERSION, STORAGE_KEY)
         self._data: dict[str, dict[str, Any]] = {}
+        self._view: Mapping[str, dict[str, Any]] = MappingProxyType(self._data)
+        # Set when tasks change, cleared once they are handed to Store for writing
+        self._dirty = False
+        # Bound once so every delayed save passes the same callable
+        self._data_provider = self._data_to_save
 
     async def async_load(self) -> dict[str, dict[str, Any]]:
         """Load data from storage."""
         stored = await self._store.async_load()
-        if stored is not None:
-            self._data = stored
-        else:
-            self._data = {}
+        # Refill the same dict so the view built in __init__ stays valid
+        self._data.clear()
+        for task_id, task in (stored or {}).items():
+            # One shared string object for the key and the task_id field
+            task_id = sys.intern(task_id)
+            if task.get("task_id") == task_id:
+                task["task_id"] = task_id
+            _intern_fields(task)
+            self._data[task_id] = task
+        self._dirty = False
         _LOGGER.debug("Loaded %d scheduled tasks from storage", len(self._data))
         return self._data
 
-    async def async_save(self) -> None:
-        """Save data to storage."""
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed save of the tasks."""
+        self._dirty = True
+        self._store.async_delay_save(self._data_provider, SAVE_DELAY)
+        _LOGGER.debug("Scheduled save of %d tasks", len(self._data))
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the tasks for a delayed write and mark them clean."""
+        self._dirty = False
+        return self._data
+
+    async def async_flush(self) -> None:
+        """Write the tasks now if they changed, replacing any pending delayed save."""
+        if not self._dirty:
+            return
+        self._dirty = False
         await self._store.async_save(self._data)
-        _LOGGER.debug("Saved %d scheduled tasks to storage", len(self._data))
 
-    async def async_add_task(
+    @callback
+    def add_task(
         self,
         task_id: str,
         scheduled_time: str,
         end_time: str,
         delay_seconds: int,
+        start_ts: float | None = None,
+        end_ts: float | None = None,
         start_actions: list[dict[str, Any]] | None = None,
         finish_actions: list[dict[str, Any]] | None = None,
         notify: bool = False,
@@ -91,12 +202,22 @@ class QuickTimerStore:
         time_mode: str = "relative",
         task_label: str | None = None,
     ) -> None:
-        """Add a scheduled task with new architecture (task_id-based, action arrays)."""
+        """Add a scheduled task with new architecture (task_id-based, action arrays).
+
+        start_ts/end_ts are the POSIX timestamps of scheduled_time/end_time; they
+        are derived from the ISO strings when not given.
+        """
+        if start_ts is None:
+            start_ts = _iso_to_timestamp(scheduled_time)
+        if end_ts is None:
+            end_ts = _iso_to_timestamp(end_time)
         self._data[task_id] = {
             "task_id": task_id,
             "task_label": task_label,
             "scheduled_time": scheduled_time,
             "end_time": end_time,
+            "start_ts": start_ts,
+            "end_ts": None if end_ts is None else float(end_ts),
             "delay_seconds": delay_seconds,
             "start_actions": start_actions or [],
             "finish_actions": finish_actions or [],
@@ -107,55 +228,90 @@ class QuickTimerStore:
             "at_time": at_time,
             "time_mode": time_mode,
         }
-        await self.async_save()
-        _LOGGER.info("Added scheduled task %s at %s (mode: %s)", task_id, scheduled_time, time_mode)
+        self.async_schedule_save()
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Added scheduled task %s at %s (mode: %s)", task_id, scheduled_time, time_mode)
 
-    async def async_remove_task(self, task_id: str) -> bool:
+    @callback
+    def remove_task(self, task_id: str) -> bool:
         """Remove a scheduled task."""
-        if task_id in self._data:
-            del self._data[task_id]
-            await self.async_save()
+        return self.pop_task(task_id) is not None
+
+    @callback
+    def pop_task(self, task_id: str) -> dict[str, Any] | None:
+        """Remove a scheduled task and return it, or None if it is unknown."""
+        task = self._data.pop(task_id, _MISSING)
+        if task is _MISSING:
+            _LOGGER.debug("No task found for %s to remove", task_id)
+            return None
+        self.async_schedule_save()
+        if _LOGGER.isEnabledFor(logging.INFO):
             _LOGGER.info("Removed scheduled task %s", task_id)
-            return True
-        _LOGGER.debug("No task found for %s to remove", task_id)
-        return False
+        return task
 
     def get_task(self, task_id: str) -> dict[str, Any] | None:
         """Get a scheduled task."""
         return self._data.get(task_id)
 
-    def get_all_tasks(self) -> dict[str, dict[str, Any]]:
-        """Get all scheduled tasks."""
-        return self._data.copy()
+    def get_all_tasks(self) -> Mapping[str, dict[str, Any]]:
+        """Get a read-only live view of all scheduled tasks (no copy)."""
+        return self._view
 
     def has_task(self, task_id: str) -> bool:
-        """Check if a task exists."""
+        """Check if a task exists.
+
+        Only for pure existence checks; use get_task (or pop_task) when the
+        task itself is needed, instead of checking first.
+        """
         return task_id in self._data
 
 
 class QuickTimerPreferencesStore:
-    """Class to manage Quick Timer user preferences storage (synced across devices)."""
+    """Class to manage Quick Timer user preferences storage (synced across devices).
+
+    Entity preference dicts are copy-on-write: updates replace the whole dict
+    for an entity, so references handed out by the getters never change and
+    must not be mutated by callers.
+    """
+
+    __slots__ = ("hass", "_store", "_data", "_data_provider", "_dirty")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the preferences store."""
         self.hass = hass
         self._store = Store(hass, PREFERENCES_STORAGE_VERSION, PREFERENCES_STORAGE_KEY)
         self._data: dict[str, dict[str, Any]] = {}
+        # Set when preferences change, cleared once they are handed to Store for writing
+        self._dirty = False
+        # Bound once so every delayed save passes the same callable
+        self._data_provider = self._data_to_save
 
     async def async_load(self) -> dict[str, dict[str, Any]]:
         """Load preferences from storage."""
-        stored = await self._store.async_load()
-        if stored is not None:
-            self._data = stored
-        else:
-            self._data = {}
+        self._data = await self._store.async_load() or {}
+        self._dirty = False
         _LOGGER.debug("Loaded preferences for %d entities", len(self._data))
         return self._data
 
-    async def async_save(self) -> None:
-        """Save preferences to storage."""
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed save of the preferences."""
+        self._dirty = True
+        self._store.async_delay_save(self._data_provider, SAVE_DELAY)
+        _LOGGER.debug("Scheduled save of preferences for %d entities", len(self._data))
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the preferences for a delayed write and mark them clean."""
+        self._dirty = False
+        return self._data
+
+    async def async_flush(self) -> None:
+        """Write the preferences now if they changed, replacing any pending delayed save."""
+        if not self._dirty:
+            return
+        self._dirty = False
         await self._store.async_save(self._data)
-        _LOGGER.debug("Saved preferences for %d entities", len(self._data))
 
     async def async_set_preferences(
         self,
@@ -163,17 +319,21 @@ class QuickTimerPreferencesStore:
         preferences: dict[str, Any],
     ) -> None:
         """Set preferences for an entity."""
-        if entity_id not in self._data:
-            self._data[entity_id] = {}
-        
-        # Merge new preferences with existing ones
-        self._data[entity_id].update(preferences)
+        # Merge new preferences with existing ones into a new dict
+        old_prefs = self._data.get(entity_id)
+        entity_prefs = {**(old_prefs or {}), **preferences}
         
         # Handle history - keep only last 3 items
-        if "history" in self._data[entity_id]:
-            self._data[entity_id]["history"] = self._data[entity_id]["history"][:3]
+        if "history" in entity_prefs:
+            entity_prefs["history"] = entity_prefs["history"][:3]
         
-        await self.async_save()
+        # Nothing changed, so there is nothing to write
+        if entity_prefs == old_prefs:
+            _LOGGER.debug("Preferences for %s unchanged", entity_id)
+            return
+        
+        self._data[entity_id] = entity_prefs
+        self.async_schedule_save()
         _LOGGER.debug("Updated preferences for %s", entity_id)
 
     async def async_add_to_history(
@@ -182,54 +342,31 @@ class QuickTimerPreferencesStore:
         history_entry: dict[str, Any],
     ) -> None:
         """Add a history entry for an entity (keeps last 3 unique entries)."""
-        if entity_id not in self._data:
-            self._data[entity_id] = {}
-        
-        if "history" not in self._data[entity_id]:
-            self._data[entity_id]["history"] = []
+        entity_prefs = self._data.get(entity_id, {})
+        entry_key = _history_key(history_entry)
         
-        history = self._data[entity_id]["history"]
-        
-        # Create a comparable key from the entry (updated for new architecture)
-        entry_key = (
-            f"{history_entry.get('time_mode', '')}_"
-            f"{history_entry.get('delay', '')}_"
-            f"{history_entry.get('unit', '')}_"
-            f"{history_entry.get('at_time', '')}_"
-            f"{str(history_entry.get('start_actions', []))}_"
-            f"{str(history_entry.get('finish_actions', []))}"
-        )
-        
-        # Remove duplicate if exists
+        # Remove every duplicate: set_preferences and older data may hold several
         history = [
-            h
-            for h in history
-            if (
-                f"{h.get('time_mode', '')}_"
-                f"{h.get('delay', '')}_"
-                f"{h.get('unit', '')}_"
-                f"{h.get('at_time', '')}_"
-                f"{str(h.get('start_actions', []))}_"
-                f"{str(h.get('finish_actions', []))}"
-            )
-            != entry_key
+            h for h in entity_prefs.get("history", []) if _history_key(h) != entry_key
         ]
         
         # Add new entry at the beginning
         history.insert(0, history_entry)
         
         # Keep only last 3
-        self._data[entity_id]["history"] = history[:3]
+        self._data[entity_id] = {**entity_prefs, "history": history[:3]}
         
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.debug("Added history entry for %s", entity_id)
 
     def get_preferences(self, entity_id: str) -> dict[str, Any]:
-        """Get preferences for an entity."""
-        # Return deep copy to prevent reference issues
-        data = self._data.get(entity_id, {})
-        return copy.deepcopy(data) if data else {}
+        """Get preferences for an entity (read-only snapshot)."""
+        return self._data.get(entity_id, {})
 
     def get_all_preferences(self) -> dict[str, dict[str, Any]]:
-        """Get all preferences - returns deep copy to ensure HA detects state changes."""
-        return copy.deepcopy(self._data)
+        """Get all preferences.
+
+        Returns a new top-level dict so HA detects state changes; the entity
+        dicts are shared read-only snapshots.
+        """
+        return dict(self._data)